@@ -19,7 +19,7 @@ test_folder = pathlib.Path(__file__).parent.resolve()
 project_folder = test_folder.parent.resolve()
 sys.path.insert(0, str(project_folder))
 
-from timezone_table import format_meeting, main, CITY_ZONES, read_city_zones, write_xl_table, create_parser
+from timezone_table import format_meeting, main, CITY_ZONES, convert_meeting, read_city_zones, write_xl_table, create_parser, CityIndex, build_city_index, iter_markdown, TimeGrid, WORK_HOURS, SLEEP_HOURS, UNAVAILABLE
 
 @pytest.fixture
 def mock_argv():
@@ -278,6 +278,12 @@ def test_create_parser():
     assert args.generate_24hour_xlsx is False
     assert args.output_file == "24hour_timezones.xlsx"
     assert args.cities_file == "cities.json"
+    assert args.markdown_output is None
+    assert args.json_output is None
+    assert args.csv_output is None
+    assert args.from_city is None
+    assert args.cities is None
+    assert args.gazetteer_file is None
 
     # Test with flags
     args_with_flags = parser.parse_args(
@@ -354,6 +360,97 @@ def test_main_with_cities_file(capsys, tmp_path):
     assert "London" not in output
 
 
+def test_main_with_output_file(capsys, mock_argv, tmp_path):
+    """--markdown-output writes the Markdown table to a file instead of stdout."""
+    output_file = tmp_path / "summary.md"
+    mock_argv.append(f"--markdown-output={output_file}")
+    main(mock_argv)
+
+    assert "# Meeting Time Converter" not in capsys.readouterr().out
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "# Meeting Time Converter"
+    assert "**Original time:** 2026-01-14 10:00 PST (America/Los_Angeles)" in lines
+    assert any(line.startswith("| New York ") and "13:00 – 14:00 | EST |" in line for line in lines)
+
+
+def test_iter_markdown_rows_match_format_meeting():
+    start = datetime.datetime(2026, 1, 14, 10, 0, tzinfo=ZoneInfo("America/Los_Angeles"))
+    end = start + datetime.timedelta(minutes=60)
+    city_zones = [("San Diego", "America/Los_Angeles"), ("Seoul", "Asia/Seoul")]
+    lines = list(iter_markdown(start, "America/Los_Angeles", 60, convert_meeting(start, end, city_zones)))
+
+    assert all(line.endswith("\n") for line in lines)
+    assert lines[-2] == format_meeting(start, end, "San Diego", "America/Los_Angeles", 11) + "\n"
+    assert lines[-1] == "| Seoul       | 03:00 – 04:00 | KST |\n"
+
+
+def test_main_all_artifacts_in_one_run(capsys, mock_argv, tmp_path):
+    """One run writes Markdown, XLSX, JSON and CSV from the same conversion."""
+    mock_argv.extend([
+        f"--markdown-output={tmp_path / 'summary.md'}",
+        "--generate-24hour-xlsx", f"--output-file={tmp_path / 'table.xlsx'}",
+        f"--json-output={tmp_path / 'meeting.json'}",
+        f"--csv-output={tmp_path / 'meeting.csv'}",
+    ])
+    main(mock_argv)
+    output = capsys.readouterr().out
+
+    assert "Generated 24-hour XLSX:" in output
+    assert "Generated JSON:" in output
+    assert "Generated CSV:" in output
+    assert "| New York " in (tmp_path / "summary.md").read_text(encoding="utf-8")
+    assert openpyxl.load_workbook(tmp_path / "table.xlsx")["24-Hour Timezones"].max_row == 26
+
+    data = json.loads((tmp_path / "meeting.json").read_text(encoding="utf-8"))
+    assert data["original"] == "2026-01-14T10:00:00-08:00"
+    assert data["duration_minutes"] == 60
+    new_york = next(c for c in data["cities"] if c["city"] == "New York")
+    assert new_york == {
+        "city": "New York",
+        "timezone": "America/New_York",
+        "start": "2026-01-14T13:00:00-05:00",
+        "end": "2026-01-14T14:00:00-05:00",
+        "abbreviation": "EST",
+        "error": None,
+    }
+
+    csv_lines = (tmp_path / "meeting.csv").read_text(encoding="utf-8").splitlines()
+    assert csv_lines[0] == "city,timezone,start,end,abbreviation,error"
+    assert "New York,America/New_York,2026-01-14T13:00:00-05:00,2026-01-14T14:00:00-05:00,EST," in csv_lines
+    assert len(csv_lines) == len(data["cities"]) + 1
+
+
+def test_main_reports_other_artifacts_when_one_fails(capsys, mock_argv, tmp_path):
+    """A failing writer does not hide the artifacts that were written."""
+    mock_argv.extend([
+        f"--markdown-output={tmp_path / 'summary.md'}",
+        "--generate-24hour-xlsx", f"--output-file={tmp_path / 'table.xlsx'}",
+        f"--json-output={tmp_path / 'missing_dir' / 'meeting.json'}",
+        f"--csv-output={tmp_path / 'meeting.csv'}",
+    ])
+    with pytest.raises(FileNotFoundError):
+        main(mock_argv)
+    output = capsys.readouterr().out
+
+    assert "Generated JSON:" not in output
+    assert "Generated 24-hour XLSX:" in output
+    assert "Generated CSV:" in output
+    assert (tmp_path / "table.xlsx").exists()
+
+
+def test_main_reports_artifacts_when_markdown_fails(capsys, mock_argv, tmp_path):
+    """A failing Markdown writer does not hide the artifacts that were written."""
+    mock_argv.extend([
+        f"--markdown-output={tmp_path / 'missing_dir' / 'summary.md'}",
+        f"--json-output={tmp_path / 'meeting.json'}",
+    ])
+    with pytest.raises(FileNotFoundError):
+        main(mock_argv)
+
+    assert "Generated JSON:" in capsys.readouterr().out
+    assert (tmp_path / "meeting.json").exists()
+
+
 def test_write_xl_table_dateline_dates(tmp_path):
     """Test that the date row shows per-city local dates across the dateline.
 
@@ -377,6 +474,144 @@ def test_write_xl_table_dateline_dates(tmp_path):
     assert ws["C2"].value == "2026-01-16"  # Sydney: 01:00 AEDT next day
 
 
+## ── City index tests ────────────────────────────────────────────────────
+
+
+def test_city_index_lookup():
+    index = CityIndex([
+        ("San Diego", "America/Los_Angeles"),
+        ("San Juan", "America/Puerto_Rico"),
+        ("Zürich", "Europe/Zurich"),
+        ("Seoul", "Asia/Seoul"),
+    ])
+    assert index.lookup("Seoul") == ("Seoul", "Asia/Seoul")
+    assert index.lookup("  seoul ") == ("Seoul", "Asia/Seoul")  # Case and spacing
+    assert index.lookup("zurich") == ("Zürich", "Europe/Zurich")  # Accent folding
+    assert index.lookup("San D") == ("San Diego", "America/Los_Angeles")  # Unique prefix
+    assert index.lookup("Seuol") == ("Seoul", "Asia/Seoul")  # Fuzzy
+    assert index.complete("san") == [
+        ("San Diego", "America/Los_Angeles"),
+        ("San Juan", "America/Puerto_Rico"),
+    ]
+    with pytest.raises(ValueError, match=r"Ambiguous city"):
+        index.lookup("San")
+    with pytest.raises(ValueError, match=r"Unknown city"):
+        index.lookup("Atlantis")
+    # Fuzzy candidates share the first letter, so that letter must be right
+    assert index.buckets[("s", 5)] == ["seoul"]
+    with pytest.raises(ValueError, match=r"Unknown city"):
+        index.lookup("Xeoul")
+
+
+def test_build_city_index_sources(tmp_path):
+    """The index covers IANA keys and lets the gazetteer file override them."""
+    gazetteer = tmp_path / "gazetteer.json"
+    gazetteer.write_text(json.dumps([
+        {"city": "Busan", "timezone": "Asia/Seoul"},
+        {"city": "Tokyo", "timezone": "Asia/Seoul"},  # Deliberate override
+    ]))
+    index = build_city_index(tmp_path / "no_cities.json", gazetteer)
+    assert index.lookup("Buenos Aires") == ("Buenos Aires", "America/Argentina/Buenos_Aires")
+    assert index.lookup("Kolkata") == ("Kolkata", "Asia/Kolkata")
+    assert index.lookup("Busan") == ("Busan", "Asia/Seoul")
+    assert index.lookup("Tokyo") == ("Tokyo", "Asia/Seoul")
+
+
+def test_main_with_city_names(capsys):
+    """--from-city and --cities accept city names instead of IANA keys."""
+    argv = [
+        "timezone_table.py",
+        "2026", "1", "14", "10", "0", "America/Los_Angeles", "60",
+        "--from-city=Seoul", "--cities=Paris, Tokyo",
+    ]
+    main(argv)
+    output = capsys.readouterr().out
+    assert "**Original time:** 2026-01-14 10:00 KST (Asia/Seoul)" in output
+    assert "| Paris " in output and "02:00 – 03:00" in output
+    assert "| Tokyo " in output and "10:00 – 11:00" in output
+    assert "San Diego" not in output
+
+
+def test_main_city_name_as_timezone(capsys, mock_argv):
+    mock_argv[6] = "New York"
+    main(mock_argv)
+    output = capsys.readouterr().out
+    assert "**Original time:** 2026-01-14 10:00 EST (America/New_York)" in output
+
+
+def test_main_iana_key_skips_city_index(capsys, mock_argv):
+    """A plain IANA-key run never builds the city index."""
+    with patch("timezone_table.build_city_index") as build:
+        main(mock_argv)
+    build.assert_not_called()
+    assert "| New York " in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("cities", ["", ",", " , "])
+def test_main_empty_cities(capsys, mock_argv, cities):
+    mock_argv.append(f"--cities={cities}")
+    with pytest.raises(SystemExit):
+        main(mock_argv)
+    assert "--cities must name at least one city" in capsys.readouterr().err
+
+
+def test_main_city_mapped_to_missing_zone(capsys, mock_argv, tmp_path):
+    """A city-list entry pointing at a nonexistent zone exits cleanly."""
+    cities_file = tmp_path / "bad.json"
+    cities_file.write_text(json.dumps([{"city": "Bogus", "timezone": "Nope/Nowhere"}]))
+    mock_argv[6] = "Bogus"
+    mock_argv.append(f"--cities-file={cities_file}")
+    with pytest.raises(SystemExit):
+        main(mock_argv)
+    assert "Invalid timezone: Nope/Nowhere" in capsys.readouterr().out
+
+
+def test_main_unknown_city(capsys, mock_argv):
+    mock_argv.append("--from-city=Atlantis")
+    with pytest.raises(SystemExit):
+        main(mock_argv)
+    assert "Unknown city" in capsys.readouterr().out
+
+
+def test_time_grid_columns():
+    """TimeGrid keeps cells in typed arrays and exposes columns as views."""
+    base_start = datetime.datetime(2026, 3, 8, 0, 0, tzinfo=ZoneInfo("America/Los_Angeles"))
+    city_zones = [("Los Angeles", "America/Los_Angeles"), ("Nowhere", "Invalid/TZ")]
+    grid = TimeGrid.hourly(base_start, 24, city_zones)
+
+    assert grid.n_instants == 24
+    assert len(grid.minutes) == len(grid.classes) == 48
+    assert grid.abbreviations == ["PST", "PDT"]  # Interned once each
+
+    minutes = grid.column("minutes", 0)
+    assert isinstance(minutes, memoryview)
+    assert minutes.obj is grid.minutes  # Zero-copy
+    assert minutes[1] == 60 and minutes[2] == 3 * 60  # 02:00 PST is skipped
+    assert list(grid.column("offsets", 0)[1:3]) == [-8 * 60, -7 * 60]
+
+    assert grid.label(0, 0) == "00:00 PST"
+    assert grid.label(2, 0) == "03:00 PDT"
+    assert grid.classes[0] == SLEEP_HOURS
+    assert grid.column("classes", 0)[10] == WORK_HOURS  # 11:00 PDT
+    assert set(grid.column("classes", 1)) == {UNAVAILABLE}
+    assert grid.label(0, 1) == "Unavailable"
+    assert grid.errors == {}
+
+
+def test_write_xl_table_unlisted_input_timezone(tmp_path):
+    """Row labels work for keys ZoneInfo accepts but available_timezones() omits."""
+    output_file = tmp_path / "posixrules.xlsx"
+    base_start = datetime.datetime(2026, 1, 15, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+    # The input zone is deliberately missing from the available set
+    with patch("timezone_table.available_timezones", return_value={"Asia/Seoul"}):
+        write_xl_table("America/New_York", base_start, [("Seoul", "Asia/Seoul")], output_file)
+
+    ws = openpyxl.load_workbook(output_file)["24-Hour Timezones"]
+    assert ws["A3"].value == "00:00 EST"
+    assert ws["A4"].value == "01:00 EST"
+    assert ws["B3"].value == "14:00 KST"
+
+
 ## ── DST-focused tests ──────────────────────────────────────────────────
 
 
@@ -436,6 +671,33 @@ def test_main_spring_forward_gap_warning(capsys, tmp_path):
     assert "03:30 EDT" in captured.out
 
 
+def test_main_errors_go_to_markdown_output(capsys, mock_argv, tmp_path):
+    """Input errors reach the --markdown-output file, e.g. the job summary."""
+    output_file = tmp_path / "summary.md"
+    mock_argv[6] = "Invalid/TZ"
+    mock_argv.append(f"--markdown-output={output_file}")
+    with pytest.raises(SystemExit):
+        main(mock_argv)
+    assert "Invalid timezone: Invalid/TZ" in capsys.readouterr().out
+    assert output_file.read_text(encoding="utf-8").startswith("Invalid timezone: Invalid/TZ\n")
+
+
+def test_main_spring_forward_gap_warning_in_output_file(capsys, tmp_path):
+    """The DST-gap warning goes to the --markdown-output file with the table."""
+    output_file = tmp_path / "summary.md"
+    argv = [
+        "timezone_table.py",
+        "2026", "3", "8", "2", "30", "America/Los_Angeles", "60",
+        f"--markdown-output={output_file}",
+    ]
+    main(argv)
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("Warning: 2:30 does not exist in America/Los_Angeles")
+    assert "Using 03:30 PDT instead." in lines[0]
+    assert lines[1] == "# Meeting Time Converter"
+    assert "Warning" not in capsys.readouterr().out
+
+
 def test_main_duration_real_time_across_spring_forward(capsys, tmp_path):
     """A 60-min meeting starting at 01:30 EST across spring-forward ends at 03:30 EDT.
 
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import array
+import bisect
+import concurrent.futures
+import csv
 import datetime
+import difflib
+import functools
 import json
 import pathlib
 import sys
+import unicodedata
+
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple, NoReturn
 
 from zoneinfo import ZoneInfo, available_timezones, ZoneInfoNotFoundError
 
@@ -25,6 +35,73 @@ def get_utc_offset(tz: ZoneInfo, dt: datetime.datetime) -> datetime.timedelta:
     return dt.astimezone(tz).utcoffset() or datetime.timedelta(0)
 
 
+@functools.lru_cache(maxsize=None)
+def row_template(city_width: int) -> str:
+    """Return the format string for one table row at the given city width."""
+    return f"| {{:<{city_width}}} | {{:02d}}:{{:02d}} – {{:02d}}:{{:02d}} | {{}} |"
+
+
+class CityTime(NamedTuple):
+    """A meeting converted to one city's local time."""
+    city: str
+    timezone: str
+    start: datetime.datetime | None = None  # None if the timezone is unavailable
+    end: datetime.datetime | None = None
+    error: str | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.start is not None or self.error is not None
+
+    @property
+    def abbreviation(self) -> str:
+        start_abbr = self.start.tzname()
+        end_abbr = self.end.tzname()
+        return start_abbr if start_abbr == end_abbr else f"{start_abbr}→{end_abbr}"
+
+
+def convert_city(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    city: str,
+    tz_str: str,
+) -> CityTime:
+    """Convert the meeting to the local time of one city."""
+    tz = ZoneInfo(tz_str)
+    return CityTime(city, tz_str, start.astimezone(tz), end.astimezone(tz))
+
+
+def convert_meeting(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    city_zones: list[tuple[str, str]],
+) -> list[CityTime]:
+    """Convert the meeting for every city once, for all output formats to share."""
+    # available_timezones() walks the tz database; call it once, not per city
+    available = available_timezones()
+    result = []
+    for city, tz_str in city_zones:
+        if tz_str not in available:
+            result.append(CityTime(city, tz_str))
+            continue
+        try:
+            result.append(convert_city(start, end, city, tz_str))
+        except ValueError as e:
+            result.append(CityTime(city, tz_str, error=str(e)))
+    return result
+
+
+def format_city_time(city_time: CityTime, city_width: int) -> str:
+    """Format a table row for a converted city."""
+    local_start, local_end = city_time.start, city_time.end
+    return row_template(city_width).format(
+        city_time.city,
+        local_start.hour, local_start.minute,
+        local_end.hour, local_end.minute,
+        city_time.abbreviation,
+    )
+
+
 def format_meeting(
     start: datetime.datetime,
     end: datetime.datetime,
@@ -33,13 +110,98 @@ def format_meeting(
     city_width: int,
 ) -> str:
     """Format a table row for the meeting in local time."""
-    tz = ZoneInfo(tz_str)
-    local_start = start.astimezone(tz)
-    local_end = end.astimezone(tz)
-    start_abbr = local_start.strftime("%Z")
-    end_abbr = local_end.strftime("%Z")
-    zone_abbr = start_abbr if start_abbr == end_abbr else f"{start_abbr}→{end_abbr}"
-    return f"| {city.ljust(city_width)} | {local_start.strftime('%H:%M')} – {local_end.strftime('%H:%M')} | {zone_abbr} |"
+    return format_city_time(convert_city(start, end, city, tz_str), city_width)
+
+
+def iter_markdown(
+    meeting_start: datetime.datetime,
+    timezone: str,
+    duration_minutes: int,
+    city_times: list[CityTime],
+    warning: str | None = None,
+) -> Iterator[str]:
+    """Yield the Markdown summary line by line, each ending in a newline.
+
+    A ``warning`` (e.g. about a DST gap) is emitted before the header.
+    """
+    # Dynamic city width
+    city_width = max(len(ct.city) for ct in city_times) + 2  # Padding
+
+    if warning is not None:
+        yield f"{warning}\n"
+    yield "# Meeting Time Converter\n\n"
+    yield f"**Original time:** {meeting_start.strftime('%Y-%m-%d %H:%M %Z')} ({timezone})\n"
+    yield f"**Duration:** {duration_minutes} minutes\n\n"
+    yield f"| {'City'.ljust(city_width)} | Local Time          | Time Zone |\n"
+    yield f"|{'-' * (city_width + 2)}|---------------------|-----------|\n"
+
+    not_available = []
+    for ct in city_times:
+        if not ct.available:
+            not_available.append(ct)
+        elif ct.error is not None:
+            yield f"Error for {ct.city} ({ct.timezone}): {ct.error}\n"
+        else:
+            yield format_city_time(ct, city_width) + "\n"
+
+    if not_available:
+        yield "\n**Unavailable timezones:**\n"
+        for ct in not_available:
+            yield f"- {ct.city}: {ct.timezone}\n"
+
+
+def write_markdown(lines: Iterable[str], output_file: str | pathlib.Path | None = None) -> None:
+    """Write Markdown lines to ``output_file`` through one buffered writer, or to stdout."""
+    if output_file is None:
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
+        return
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(lines)
+
+
+def write_json(
+    meeting_start: datetime.datetime,
+    timezone: str,
+    duration_minutes: int,
+    city_times: list[CityTime],
+    output_file: str | pathlib.Path,
+) -> None:
+    """Write the converted meeting as JSON with ISO 8601 local times."""
+    data = {
+        "original": meeting_start.isoformat(),
+        "timezone": timezone,
+        "duration_minutes": duration_minutes,
+        "cities": [
+            {
+                "city": ct.city,
+                "timezone": ct.timezone,
+                "start": ct.start.isoformat() if ct.start else None,
+                "end": ct.end.isoformat() if ct.end else None,
+                "abbreviation": ct.abbreviation if ct.start else None,
+                "error": ct.error if ct.available else "Unavailable",
+            }
+            for ct in city_times
+        ],
+    }
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_csv(city_times: list[CityTime], output_file: str | pathlib.Path) -> None:
+    """Write the converted meeting as CSV, one row per city."""
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["city", "timezone", "start", "end", "abbreviation", "error"])
+        for ct in city_times:
+            if ct.start is None:
+                error = ct.error if ct.available else "Unavailable"
+                writer.writerow([ct.city, ct.timezone, "", "", "", error])
+            else:
+                writer.writerow([
+                    ct.city, ct.timezone,
+                    ct.start.isoformat(), ct.end.isoformat(), ct.abbreviation, "",
+                ])
 
 
 def read_city_zones(cities_file: str | pathlib.Path = "cities.json") -> list[tuple[str, str]]:
@@ -59,6 +221,119 @@ def read_city_zones(cities_file: str | pathlib.Path = "cities.json") -> list[tup
     return result
 
 
+# IANA areas whose last key component names a real place
+CITY_AREAS = frozenset({
+    "Africa", "America", "Antarctica", "Asia", "Atlantic",
+    "Australia", "Europe", "Indian", "Pacific",
+})
+
+
+def normalize_city(name: str) -> str:
+    """Fold a city name for lookup: case, accents, underscores and spacing."""
+    decomposed = unicodedata.normalize("NFKD", name.replace("_", " "))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class CityIndex:
+    """Sorted-array index from city names to IANA timezones.
+
+    Names are stored normalized in one sorted list with parallel lists of
+    display names and zone keys, so exact and prefix lookups are a binary
+    search.  Fuzzy matching is only attempted when both of those miss, and
+    only against names with the same first letter and a similar length.
+    """
+
+    # A fuzzy match may differ in length from the query by at most this much
+    FUZZY_LENGTH_SLACK = 2
+
+    def __init__(self, entries: list[tuple[str, str]]):
+        # Later entries take precedence over earlier ones with the same name
+        merged = {}
+        for city, tz_str in entries:
+            merged[normalize_city(city)] = (city, tz_str)
+        self.names = sorted(merged)
+        self.cities = [merged[name][0] for name in self.names]
+        self.zones = [merged[name][1] for name in self.names]
+        # (first letter, length) -> names, the candidate buckets for fuzzy matching
+        self.buckets: dict[tuple[str, int], list[str]] = {}
+        for name in self.names:
+            self.buckets.setdefault((name[:1], len(name)), []).append(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def complete(self, prefix: str) -> list[tuple[str, str]]:
+        """Return all (city, timezone) pairs whose name starts with ``prefix``."""
+        key = normalize_city(prefix)
+        i = bisect.bisect_left(self.names, key)
+        result = []
+        while i < len(self.names) and self.names[i].startswith(key):
+            result.append((self.cities[i], self.zones[i]))
+            i += 1
+        return result
+
+    def lookup(self, name: str) -> tuple[str, str]:
+        """Resolve a city name to (city, timezone).
+
+        Tries an exact match, then a unique prefix match, then the closest
+        fuzzy match.  Raises ValueError if the name cannot be resolved.
+        """
+        key = normalize_city(name)
+        i = bisect.bisect_left(self.names, key)
+        if i < len(self.names) and self.names[i] == key:
+            return self.cities[i], self.zones[i]
+
+        candidates = self.complete(key)
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            shown = ", ".join(city for city, _ in candidates[:5])
+            raise ValueError(f"Ambiguous city {name!r}: matches {shown}")
+
+        slack = self.FUZZY_LENGTH_SLACK
+        fuzzy_candidates = [
+            candidate
+            for length in range(len(key) - slack, len(key) + slack + 1)
+            for candidate in self.buckets.get((key[:1], length), ())
+        ]
+        close = difflib.get_close_matches(key, fuzzy_candidates, n=1, cutoff=0.8)
+        if close:
+            j = bisect.bisect_left(self.names, close[0])
+            return self.cities[j], self.zones[j]
+        raise ValueError(f"Unknown city: {name!r}")
+
+
+def iana_city_zones() -> list[tuple[str, str]]:
+    """Derive (city, timezone) pairs from the IANA keys, e.g. Asia/Tokyo -> Tokyo."""
+    result = []
+    # Deeper keys go last so they win: America/Argentina/Buenos_Aires is
+    # canonical, America/Buenos_Aires is a backward-compatible link.
+    for tz_str in sorted(available_timezones(), key=lambda k: (k.count("/"), k)):
+        area, _, rest = tz_str.partition("/")
+        if area in CITY_AREAS and rest:
+            result.append((rest.rsplit("/", 1)[-1].replace("_", " "), tz_str))
+    return result
+
+
+def build_city_index(
+    cities_file: str | pathlib.Path = "cities.json",
+    gazetteer_file: str | pathlib.Path | None = None,
+) -> CityIndex:
+    """Build an offline index of city names.
+
+    Sources, lowest precedence first: IANA zone keys, the built-in
+    CITY_ZONES, the cities file, and an optional gazetteer file in the
+    same JSON format as the cities file.
+    """
+    entries = iana_city_zones() + CITY_ZONES + read_city_zones(cities_file)
+    if gazetteer_file is not None:
+        if not pathlib.Path(gazetteer_file).is_file():
+            raise FileNotFoundError(f"Gazetteer file not found: {gazetteer_file}")
+        entries += read_city_zones(gazetteer_file)
+    return CityIndex(entries)
+
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate a Markdown timezone table for a meeting.",
@@ -73,8 +348,14 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument("duration_minutes", type=int, help="Duration in minutes (positive integer)")
     parser.add_argument("--sort-by-offset", action="store_true", help="Sort cities by UTC offset (west to east)")
     parser.add_argument("--generate-24hour-xlsx", action="store_true", help="Generate 24-hour XLSX table (default: false)")
-    parser.add_argument("--output-file", type=str, default="24hour_timezones.xlsx", help="Output file for XLSX")
+    parser.add_argument("--output-file", type=str, default="24hour_timezones.xlsx", help="Output file for the 24-hour XLSX table")
+    parser.add_argument("--markdown-output", type=str, default=None, help="Output file for the Markdown table (default: stdout); the XLSX file is --output-file")
+    parser.add_argument("--json-output", type=str, default=None, help="Also write the converted times to this JSON file")
+    parser.add_argument("--csv-output", type=str, default=None, help="Also write the converted times to this CSV file")
     parser.add_argument("--cities-file", type=str, default="cities.json", help="Path to cities JSON file (default: cities.json)")
+    parser.add_argument("--from-city", type=str, default=None, help="City name for the original time; overrides the timezone argument (e.g., Seoul)")
+    parser.add_argument("--cities", type=str, default=None, help="Comma-separated city names to show instead of the cities file (e.g., \"Paris,Tokyo\")")
+    parser.add_argument("--gazetteer-file", type=str, default=None, help="Extra city list in the cities JSON format, used for name lookup")
     return parser
 
 
@@ -86,27 +367,69 @@ def main(argv: list[str]) -> None:
     if args.duration_minutes <= 0:
         parser.error("Duration must be positive.")
 
+    city_names = None
+    if args.cities is not None:
+        city_names = [name for name in args.cities.split(",") if name.strip()]
+        if not city_names:
+            parser.error("--cities must name at least one city")
+
+    def fail(*lines: str) -> NoReturn:
+        """Print an error, also put it in the Markdown output, and exit."""
+        for line in lines:
+            print(line)
+        if args.markdown_output is not None:
+            try:
+                write_markdown((f"{line}\n" for line in lines), args.markdown_output)
+            except OSError:
+                pass  # The error above is already on stdout
+        sys.exit(1)
+
+    # Only build the city index when a city name actually needs resolving
+    city_index = None
+
+    def lookup_city(name: str) -> tuple[str, str]:
+        nonlocal city_index
+        if city_index is None:
+            try:
+                city_index = build_city_index(args.cities_file, args.gazetteer_file)
+            except (OSError, ValueError) as e:
+                fail(f"Invalid city list: {e}")
+        return city_index.lookup(name)
+
+    if args.from_city is not None:
+        try:
+            _, args.timezone = lookup_city(args.from_city)
+        except ValueError as e:
+            fail(str(e))
+
     try:
         tz = ZoneInfo(args.timezone)
-    except ZoneInfoNotFoundError as e:
-        print(f"Invalid timezone: {args.timezone}")
-        print(e)
-        sys.exit(1)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        # Not an IANA key; accept a city name in its place
+        try:
+            _, args.timezone = lookup_city(args.timezone)
+        except ValueError:
+            fail(f"Invalid timezone: {args.timezone}", str(e))
+        try:
+            tz = ZoneInfo(args.timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            # The city list maps the name to a zone that does not exist
+            fail(f"Invalid timezone: {args.timezone}", str(e))
 
     try:
         meeting_start = datetime.datetime(
             args.year, args.month, args.day, args.hour, args.minute, tzinfo=tz
         )
     except ValueError as e:
-        print(f"Invalid date/time: {e}")
-        sys.exit(1)
+        fail(f"Invalid date/time: {e}")
 
     # Detect DST gap: if the wall-clock time doesn't survive a UTC round-trip,
     # it fell inside a spring-forward gap.
     utc_instant = meeting_start.astimezone(datetime.timezone.utc)
     round_trip = utc_instant.astimezone(tz)
+    warning = None
     if round_trip.replace(fold=0) != meeting_start.replace(fold=0):
-        print(
+        warning = (
             f"Warning: {args.hour}:{args.minute:02d} does not exist in "
             f"{args.timezone} on this date (DST gap). "
             f"Using {round_trip.strftime('%H:%M %Z')} instead."
@@ -117,43 +440,156 @@ def main(argv: list[str]) -> None:
     # not wall-clock time (which breaks across DST transitions).
     meeting_end = utc_instant + datetime.timedelta(minutes=args.duration_minutes)
 
-    city_zones = read_city_zones(args.cities_file)
+    if city_names is not None:
+        try:
+            city_zones = [lookup_city(name) for name in city_names]
+        except ValueError as e:
+            fail(str(e))
+    else:
+        city_zones = read_city_zones(args.cities_file)
 
     # Optional: Sort by UTC offset
     if args.sort_by_offset:
         city_zones.sort(key=lambda x: get_utc_offset(ZoneInfo(x[1]), meeting_start))
 
-    # Dynamic city width
-    city_width = max(len(city) for city, _ in city_zones) + 2  # Padding
-
-    print("# Meeting Time Converter\n")
-    print(f"**Original time:** {meeting_start.strftime('%Y-%m-%d %H:%M %Z')} ({args.timezone})")
-    print(f"**Duration:** {args.duration_minutes} minutes\n")
-    print(f"| {'City'.ljust(city_width)} | Local Time          | Time Zone |")
-    print(f"|{'-' * (city_width + 2)}|---------------------|-----------|")
+    city_times = convert_meeting(meeting_start, meeting_end, city_zones)
+
+    # One run converts the meeting once and writes every artifact from it.
+    # The worker threads only overlap file I/O: the XLSX save is Python-level
+    # XML serialization that holds the GIL, so it gains little from them.
+    generated = []
+    failed = None
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        if args.generate_24hour_xlsx:
+            # Build midnight from the local date to avoid .replace() across DST boundaries.
+            local_date = meeting_start.astimezone(tz).date()
+            base_start = datetime.datetime(
+                local_date.year, local_date.month, local_date.day, tzinfo=tz
+            )
+            generated.append(("24-hour XLSX", args.output_file, executor.submit(
+                write_xl_table, args.timezone, base_start, city_zones, args.output_file
+            )))
+        if args.json_output is not None:
+            generated.append(("JSON", args.json_output, executor.submit(
+                write_json, meeting_start, args.timezone, args.duration_minutes,
+                city_times, args.json_output,
+            )))
+        if args.csv_output is not None:
+            generated.append(("CSV", args.csv_output, executor.submit(
+                write_csv, city_times, args.csv_output
+            )))
 
-    not_available = []
-    for city, tz_str in city_zones:
-        if tz_str not in available_timezones():
-            not_available.append((city, tz_str))
-            continue
         try:
-            print(format_meeting(meeting_start, meeting_end, city, tz_str, city_width))
-        except ValueError as e:
-            print(f"Error for {city} ({tz_str}): {e}")
-
-    if not_available:
-        print("\n**Unavailable timezones:**")
-        for city, tz_str in not_available:
-            print(f"- {city}: {tz_str}")
-
-    if args.generate_24hour_xlsx:
-        # Build midnight from the local date to avoid .replace() across DST boundaries.
-        local_date = meeting_start.astimezone(tz).date()
-        base_start = datetime.datetime(
-            local_date.year, local_date.month, local_date.day, tzinfo=tz
-        )
-        write_xl_table(args.timezone, base_start, city_zones, args.output_file)
+            write_markdown(
+                iter_markdown(meeting_start, args.timezone, args.duration_minutes, city_times, warning),
+                args.markdown_output,
+            )
+        except Exception as e:  # Re-raised below, after reporting the others
+            failed = e
+
+    # Report after all writers finish so nothing interleaves with stdout Markdown;
+    # report every success before re-raising the first failure.
+    for label, output_file, future in generated:
+        if future.exception() is None:
+            print(f"Generated {label}: {output_file}")
+        elif failed is None:
+            failed = future.exception()
+    if failed is not None:
+        raise failed
+
+
+# Hour classes stored in TimeGrid.classes
+OTHER_HOURS = 0
+WORK_HOURS = 1  # 09:00–17:00 local, green in the XLSX
+SLEEP_HOURS = 2  # 22:00–07:00 local, gray in the XLSX
+UNAVAILABLE = 3
+ERROR = 4
+
+
+def hour_class(local_hour: int) -> int:
+    """Classify a local hour as work, sleep or other hours."""
+    if 9 <= local_hour < 17:
+        return WORK_HOURS
+    if 0 <= local_hour < 7 or 22 <= local_hour < 24:
+        return SLEEP_HOURS
+    return OTHER_HOURS
+
+
+class TimeGrid:
+    """Local times of a series of instants across cities, in typed columns.
+
+    Each column (one per city) is a contiguous run of ``n_instants`` items
+    in flat arrays: minutes of the local day, UTC offsets in minutes, ids
+    into the interned ``abbreviations`` list, and hour classes.  A cell
+    costs 7 bytes instead of a string and a spreadsheet cell object.
+    """
+
+    def __init__(self, instants: list[datetime.datetime], city_zones: list[tuple[str, str]]):
+        self.instants = instants
+        self.city_zones = city_zones
+        self.n_instants = n = len(instants)
+        size = n * len(city_zones)
+        self.minutes = array.array("h", [0]) * size
+        self.offsets = array.array("h", [0]) * size
+        self.abbr_ids = array.array("H", [0]) * size
+        self.classes = array.array("b", [0]) * size
+        self.abbreviations: list[str] = []
+        self.errors: dict[int, str] = {}  # Column -> message, for ERROR columns
+
+        abbr_ids: dict[str, int] = {}
+        # available_timezones() walks the tz database; call it once, not per cell
+        available = available_timezones()
+        for col, (_, tz_str) in enumerate(city_zones):
+            first = col * n
+            if tz_str not in available:
+                self.classes[first:first + n] = array.array("b", [UNAVAILABLE]) * n
+                continue
+            try:
+                tz = ZoneInfo(tz_str)
+            except ValueError as e:
+                self.classes[first:first + n] = array.array("b", [ERROR]) * n
+                self.errors[col] = str(e)
+                continue
+            for i, instant in enumerate(instants, first):
+                local = instant.astimezone(tz)
+                abbr = local.tzname()
+                abbr_id = abbr_ids.get(abbr)
+                if abbr_id is None:
+                    abbr_id = abbr_ids[abbr] = len(self.abbreviations)
+                    self.abbreviations.append(abbr)
+                self.minutes[i] = local.hour * 60 + local.minute
+                self.offsets[i] = local.utcoffset() // datetime.timedelta(minutes=1)
+                self.abbr_ids[i] = abbr_id
+                self.classes[i] = hour_class(local.hour)
+
+    @classmethod
+    def hourly(
+        cls,
+        base_start: datetime.datetime,
+        hours: int,
+        city_zones: list[tuple[str, str]],
+    ) -> TimeGrid:
+        """Build a grid of ``hours`` consecutive hours from ``base_start``."""
+        # Iterate in UTC so each row is a real, distinct instant —
+        # wall-clock arithmetic would create phantom or missing hours on DST days.
+        base_utc = base_start.astimezone(datetime.timezone.utc)
+        instants = [base_utc + datetime.timedelta(hours=hour) for hour in range(hours)]
+        return cls(instants, city_zones)
+
+    def column(self, name: str, col: int) -> memoryview:
+        """Return a zero-copy view of one city's column of ``name`` (e.g. "minutes")."""
+        return memoryview(getattr(self, name))[col * self.n_instants:(col + 1) * self.n_instants]
+
+    def label(self, row: int, col: int) -> str:
+        """Format a cell as "HH:MM ABBR", or as its unavailable/error text."""
+        i = col * self.n_instants + row
+        code = self.classes[i]
+        if code == UNAVAILABLE:
+            return "Unavailable"
+        if code == ERROR:
+            return f"Error: {self.errors[col]}"
+        hour, minute = divmod(self.minutes[i], 60)
+        return f"{hour:02d}:{minute:02d} {self.abbreviations[self.abbr_ids[i]]}"
 
 
 def write_xl_table(
@@ -163,64 +599,57 @@ def write_xl_table(
     output_file: str | pathlib.Path = "24hour_timezones.xlsx"
 ):
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "24-Hour Timezones"
+    # Write-only mode streams rows to the file instead of keeping a Cell per value
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("24-Hour Timezones")
+
+    def styled(value: str, **style) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        for name, setting in style.items():
+            setattr(cell, name, setting)
+        return cell
 
     # Header
+    bold = Font(bold=True)
     header = [f"Input Hour ({timezone})"] + [f"{city} ({tz_str})" for city, tz_str in city_zones]
-    ws.append(header)
-    for cell in ws[1]:
-        cell.font = Font(bold=True)
+    ws.append([styled(value, font=bold) for value in header])
+
+    grid = TimeGrid.hourly(base_start, 24, city_zones)
+    classes = [grid.column("classes", col) for col in range(len(city_zones))]
 
-    # Date row — show each city's local date (may differ across the dateline)
+    # Date row — show each city's local date (may differ across the dateline),
+    # from the first instant in UTC shifted by the city's stored UTC offset
+    first_utc = grid.instants[0]
     date_row = ["Date"]
-    for city, tz_str in city_zones:
-        if tz_str not in available_timezones():
+    for col in range(len(city_zones)):
+        if classes[col][0] in (UNAVAILABLE, ERROR):
             date_row.append("")
         else:
-            local_midnight = base_start.astimezone(ZoneInfo(tz_str))
-            date_row.append(local_midnight.strftime('%Y-%m-%d'))
+            offset = datetime.timedelta(minutes=grid.column("offsets", col)[0])
+            date_row.append((first_utc + offset).strftime('%Y-%m-%d'))
     ws.append(date_row)
 
     # Colors
-    green_fill = PatternFill(start_color="FF90EE90", end_color="FF90EE90", fill_type="solid")  # Work hours
-    gray_fill = PatternFill(start_color="FFA9A9A9", end_color="FFA9A9A9", fill_type="solid")  # Sleep hours
-
-    # Iterate in UTC so each row is a real, distinct instant —
-    # wall-clock arithmetic would create phantom or missing hours on DST days.
-    base_utc = base_start.astimezone(datetime.timezone.utc)
-    for hour in range(24):
-        hour_utc = base_utc + datetime.timedelta(hours=hour)
-        hour_local = hour_utc.astimezone(ZoneInfo(timezone))
-        row = [hour_local.strftime('%H:%M %Z')]
-        for city, tz_str in city_zones:
-            if tz_str not in available_timezones():
-                row.append("Unavailable")
-                continue
-            try:
-                local_start = hour_utc.astimezone(ZoneInfo(tz_str))
-                row.append(local_start.strftime('%H:%M %Z'))
-            except ValueError as e:
-                row.append(f"Error: {e}")
+    fills = {
+        WORK_HOURS: PatternFill(start_color="FF90EE90", end_color="FF90EE90", fill_type="solid"),
+        SLEEP_HOURS: PatternFill(start_color="FFA9A9A9", end_color="FFA9A9A9", fill_type="solid"),
+    }
+
+    # Row labels come straight from the input timezone, which main() has
+    # already accepted even if available_timezones() does not list it.
+    input_tz = ZoneInfo(timezone)
+    for hour, hour_utc in enumerate(grid.instants):
+        row = [hour_utc.astimezone(input_tz).strftime('%H:%M %Z')]
+        for col in range(len(city_zones)):
+            label = grid.label(hour, col)
+            fill = fills.get(classes[col][hour])
+            row.append(label if fill is None else styled(label, fill=fill))
         ws.append(row)
 
-        # Apply colors based on local hour
-        for col in range(2, len(row) + 1):
-            local_time_str = row[col - 1]
-            if "Unavailable" in local_time_str or "Error" in local_time_str:
-                continue
-            local_hour = int(local_time_str.split(':')[0])
-            cell = ws.cell(row=ws.max_row, column=col)
-            if 9 <= local_hour < 17:
-                cell.fill = green_fill
-            elif 0 <= local_hour < 7 or 22 <= local_hour < 24:
-                cell.fill = gray_fill
-
     wb.save(output_file)
-    print(f"Generated 24-hour XLSX: {str(output_file)}")
 
 
 if __name__ == "__main__":